@@ -1,85 +1,102 @@
 import bitarray as ba
+import bitarray.util
+import numpy as np
 import uuid
 
-# --- Pre-calculated table for which bits each parity bit checks ---
-PARITY_BIT_TABLE = {
-    p_bit: [bit_pos for bit_pos in range(1, 72) if (bit_pos & p_bit)]
-    for p_bit in (1, 2, 4, 8, 16, 32, 64)
-}
-
-def encode(data_str: str) -> ba.bitarray:
+# --- Pre-calculated masks of which bits each parity bit checks ---
+PARITY_BITS = (1, 2, 4, 8, 16, 32, 64)
+
+# Bit (pos - 1) of PARITY_MASKS[i] is set iff 1-based position pos is checked
+# by parity bit PARITY_BITS[i]. Codewords are 72 bits wide, so these are
+# Python ints rather than uint64.
+PARITY_MASKS = tuple(
+    sum(1 << (pos - 1) for pos in range(1, 72) if pos & p_bit)
+    for p_bit in PARITY_BITS
+)
+
+# 1-based codeword positions that carry data (everything but the powers of
+# two and the overall parity bit at 72), in data-bit order.
+DATA_POSITIONS = tuple(pos for pos in range(1, 72) if pos & (pos - 1))
+
+# Parity-check matrix: row i has a 1 at every (0-based) position checked by
+# parity bit 1 << i, so the Hamming syndrome of a codeword is H @ code % 2.
+H = np.array(
+    [[(mask >> idx) & 1 for idx in range(72)] for mask in PARITY_MASKS],
+    dtype=np.uint8,
+)
+
+# Weights turning a syndrome bit vector [s1, s2, s4, ...] into its integer
+SYNDROME_WEIGHTS = 1 << np.arange(7, dtype=np.int64)
+
+# For each parity bit, a 64-bit mask of the *data* bits it checks.
+# Parity bits never check one another, so these masks alone decide them.
+DATA_PARITY_MASKS = tuple(
+    sum(1 << data_idx for data_idx, pos in enumerate(DATA_POSITIONS) if pos & p_bit)
+    for p_bit in PARITY_BITS
+)
+
+# The data positions form contiguous runs between powers of two, so the 64
+# data bits can be scattered into the codeword with one shift per run.
+# Each entry is (first data bit, run length, first 1-based position).
+DATA_RUNS = tuple(
+    (DATA_POSITIONS.index(start), end - start, start)
+    for start, end in ((3, 4), (5, 8), (9, 16), (17, 32), (33, 64), (65, 72))
+)
+
+def encode(data: int) -> ba.bitarray:
     """
-    Encodes a 64-bit data string into a 72-bit SECDED Hamming codeword.
-    This function is correct.
+    Encodes a 64-bit integer into a 72-bit SECDED Hamming codeword.
+    Data bit k (LSB first) is stored at the k-th data position.
     """
-    codeword = ba.bitarray(72)
-    codeword.setall(0)
-    data_idx = 0
-
     # Place all 64 data bits
-    for i in range(72):
-        pos = i + 1 # 1-based position
-        is_power_of_two = (pos & (pos - 1) == 0) and pos != 0
-        is_oparity_bit = (pos == 72)
-
-        if is_power_of_two or is_oparity_bit:
-            continue
-
-        codeword[i] = int(data_str[data_idx])
-        data_idx += 1
-        
-    # Calculate and set the 7 Hamming parity bits 
-    for key in PARITY_BIT_TABLE:
-        positions_to_check = PARITY_BIT_TABLE[key]
-        p_bit = xor_at_positions(codeword, *positions_to_check)
-        codeword[key-1] = p_bit 
-
-    # Calculate and set the 8th (Overall) parity bit 
-    oparate = 0
-    for bit in codeword:
-        oparate ^= int(bit)
-    
-    codeword[71] = oparate
-    return codeword
+    codeword = 0
+    for data_idx, length, pos in DATA_RUNS:
+        codeword |= ((data >> data_idx) & ((1 << length) - 1)) << (pos - 1)
+
+    # Calculate and set the 7 Hamming parity bits
+    for p_bit, mask in zip(PARITY_BITS, DATA_PARITY_MASKS):
+        codeword |= ((data & mask).bit_count() & 1) << (p_bit - 1)
+
+    # Calculate and set the 8th (Overall) parity bit
+    codeword |= (codeword.bit_count() & 1) << 71
 
+    return ba.util.int2ba(codeword, length=72, endian='little')
 
-def xor_at_positions(codeword: ba.bitarray, *positions: int) -> int:
+
+def _syndromes(codes: np.ndarray) -> (np.ndarray, np.ndarray):
     """
-    Helper function to XOR bits at specified 1-based positions.
-    This function is correct.
+    Computes the Hamming and overall parity syndromes of a (B, 72) batch
+    of codewords.
     """
-    result = 0
-    for pos in positions: #these are one based
-        idx = pos - 1
-        result ^= int(codeword[idx])
-    return result
+    # The 7-bit Hamming Syndrome, as an integer "error pointer"
+    s_h = ((codes @ H.T) & 1) @ SYNDROME_WEIGHTS
+    # The 1-bit Overall Parity Syndrome
+    s_p = codes.sum(axis=-1, dtype=np.int64) & 1
+    return s_h, s_p
 
 
-def decode(codeword: ba.bitarray) -> (str, int):
+def decode(codeword: ba.bitarray | np.ndarray) -> (str, int):
     """
     Decodes a 72-bit SECDED codeword and reports its status.
+    The codeword may be a bitarray or an array of 72 0/1 values.
     Returns a tuple: (status_message, error_position)
     error_position is 0 if no correctable error.
     """
-    
-    # Calculate the 7-bit Hamming Syndrome
-    s_list = []
-    for p_bit in (1, 2, 4, 8, 16, 32, 64):
-        positions_to_check = PARITY_BIT_TABLE[p_bit]
-        check_bit = xor_at_positions(codeword, *positions_to_check)
-        s_list.append(check_bit) # List will be [s1, s2, s4, ...]
-
-    # Convert the syndrome list [s1, s2, s4...] into an integer
+    if isinstance(codeword, ba.bitarray):
+        code = ba.util.ba2int(ba.bitarray(codeword, endian='little'))
+        # Calculate the 1-bit Overall Parity Syndrome (count() runs in C)
+        s_p = codeword.count() & 1
+    else:
+        bits = np.packbits(np.asarray(codeword, dtype=np.uint8), bitorder='little')
+        code = int.from_bytes(bits.tobytes(), 'little')
+        # Calculate the 1-bit Overall Parity Syndrome
+        s_p = code.bit_count() & 1
+
+    # Calculate the 7-bit Hamming Syndrome and convert it into an integer.
     # This integer is the "error pointer"
     s_h_int = 0
-    for i, bit in enumerate(s_list):
-        if bit == 1:
-            s_h_int += (1 << i) # Reconstructs the position: 1*s1 + 2*s2 + 4*s4...
-            
-    # Calculate the 1-bit Overall Parity Syndrome
-    s_p = 0
-    for bit in codeword:
-        s_p ^= int(bit)
+    for i, mask in enumerate(PARITY_MASKS):
+        s_h_int |= ((code & mask).bit_count() & 1) << i
 
     # Interpret the two syndromes together
     
@@ -107,6 +124,28 @@ def decode(codeword: ba.bitarray) -> (str, int):
     # This should not be reachable
     return ("UNKNOWN_ERROR", 0)
 
+def decode_batch(codes: np.ndarray) -> (np.ndarray, np.ndarray):
+    """
+    Decodes a (B, 72) array of 0/1 codewords in one pass.
+    Returns (statuses, positions) arrays of length B, with the same
+    status strings and error positions that decode() gives per word.
+    """
+    codes = np.asarray(codes, dtype=np.uint8)
+    s_h, s_p = _syndromes(codes)
+
+    no_error = (s_h == 0) & (s_p == 0)
+    single = (s_h != 0) & (s_p == 1)
+    double = (s_h != 0) & (s_p == 0)
+    parity_bit_error = (s_h == 0) & (s_p == 1)
+
+    statuses = np.select(
+        [no_error, single, double, parity_bit_error],
+        ["NO_ERROR", "SINGLE_ERROR", "DOUBLE_ERROR_DETECTED", "SINGLE_ERROR"],
+        default="UNKNOWN_ERROR",
+    )
+    positions = np.where(single, s_h, np.where(parity_bit_error, 72, 0))
+    return statuses, positions
+
 def flip_bit(codeword: ba.bitarray, one_based_pos: int):
     """Helper function to test errors."""
     idx = one_based_pos - 1
@@ -115,10 +154,10 @@ def flip_bit(codeword: ba.bitarray, one_based_pos: int):
 
 
 # #  Main execution 
-# int_64_str = format(uuid.uuid4().int & (1<<64)-1, '064b')
-# print(f"Original data: {int_64_str}")
+# data_64 = uuid.uuid4().int & (1<<64)-1
+# print(f"Original data: {data_64:064b}")
 
-# encoded_data = encode(int_64_str)
+# encoded_data = encode(data_64)
 # print(f"Encoded data:  {encoded_data.to01()}")
 
 # # Test 1: Check the clean data
@@ -139,7 +178,7 @@ def flip_bit(codeword: ba.bitarray, one_based_pos: int):
 
 # # Test 4: Check a single parity bit error
 # # re-encode to get a clean copy
-# encoded_data = encode(int_64_str)
+# encoded_data = encode(data_64)
 # # flip a parity bit (e.g., at position 4)
 # flip_bit(encoded_data, 4)
 # status, err_pos = decode(encoded_data)
@@ -0,0 +1,181 @@
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
+import matplotlib.pyplot as plt
+from numba import njit, prange
+
+NAND_TYPES = {
+    "1": {"name": "SLC (Single-Level Cell)", "mean": 100000, "std_dev": 10000},
+    "2": {"name": "MLC (Multi-Level Cell)", "mean": 10000, "std_dev": 1000},
+    "3": {"name": "TLC (Triple-Level Cell)", "mean": 3000, "std_dev": 300},
+}
+
+@dataclass
+class CellBlock:
+    """
+    Per-cell state of a simulated block, stored as parallel contiguous arrays
+    (one entry per cell) rather than as per-cell objects. With ideal wear
+    leveling every cell has seen the same number of P/E cycles, so only the
+    endurance thresholds need to be kept per cell.
+    """
+    thresholds: np.ndarray
+
+    def __post_init__(self):
+        self.thresholds = np.ascontiguousarray(self.thresholds)
+
+    @classmethod
+    def sample(cls, num_cells, mean_endurance, std_dev, max_cycles, rng):
+        """
+        Creates a fresh block with normally distributed endurance thresholds.
+        Thresholds are clipped to [0, max_cycles]: a cell that outlasts the
+        simulation behaves the same whatever its exact threshold, and the
+        clip lets them use the narrowest dtype that holds max_cycles.
+        """
+        dtype = np.uint16 if max_cycles < np.iinfo(np.uint16).max else np.uint32
+        # Draw float32 normals straight into one buffer and scale them in place
+        buf = np.empty(num_cells, dtype=np.float32)
+        rng.standard_normal(dtype=np.float32, out=buf)
+        buf *= std_dev
+        buf += mean_endurance
+        np.clip(buf, 0, max_cycles, out=buf)
+        thresholds = buf.astype(dtype)
+        assert thresholds.max(initial=0) <= max_cycles
+        return cls(thresholds=thresholds)
+
+@lru_cache
+def sample_cycles(max_cycles, num_points=300):
+    """
+    Returns the cycles at which BER is sampled, instead of one row per cycle.
+    A geometric schedule resolves the first failures early in life, and an
+    evenly spaced one keeps the wear-out S-curve smooth on the linear x-axis;
+    together they are a few hundred integers in [1, max_cycles].
+    """
+    geometric = np.geomspace(1, max_cycles, num_points)
+    linear = np.linspace(1, max_cycles, num_points)
+    cycles = np.union1d(np.round(geometric), np.round(linear)).astype(np.int64)
+    # The result is cached and shared between calls, so keep it read-only
+    cycles.flags.writeable = False
+    return cycles
+
+@njit(cache=True, fastmath=True)
+def _simulate(thresh, cycles):
+    """
+    Steps the block through the given P/E cycles and counts the failed cells.
+    Every cell's P/E count equals the cycle number, so a cell has failed
+    once its threshold is below it; no per-cell counter is needed.
+    """
+    out = np.empty(cycles.shape[0], dtype=np.int64)
+    for k in range(cycles.shape[0]):
+        c = cycles[k]
+        n = 0
+        for i in range(thresh.shape[0]):
+            n += thresh[i] < c
+        out[k] = n
+    return out
+
+def run_simulation(num_cells, mean_endurance, std_dev, seed=None, step_cycles=False):
+    """
+    Runs a single NAND endurance simulation and returns the results as
+    (cycle, BER) rows on the sample_cycles schedule.
+    With step_cycles=True every cell is checked at each sampled cycle (a hook
+    for per-cycle effects) instead of using the closed-form failure count.
+    """
+    # Calculate a dynamic simulation length
+    max_cycles = mean_endurance + (4 * std_dev)
+
+    # Generate the endurance thresholds for each cell. Each run builds its own
+    # generator (fresh entropy when seed is None), so forked worker processes
+    # never share a random stream.
+    rng = np.random.default_rng(seed)
+    block = CellBlock.sample(num_cells, mean_endurance, std_dev, max_cycles, rng)
+
+    cycles = sample_cycles(max_cycles)
+
+    # Fill the (cycle, BER) table in place rather than stacking temporaries
+    results = np.empty((cycles.size, 2), dtype=np.float64)
+    results[:, 0] = cycles
+
+    if step_cycles:
+        results[:, 1] = _simulate(block.thresholds, cycles)
+    else:
+        # A cell fails once its P/E count exceeds its threshold, so after
+        # `cycle` cycles the failed cells are exactly those with
+        # threshold < cycle. Sorting once turns each count into a binary search.
+        # The block is private to this run and cell order doesn't matter, so
+        # sort it in place rather than allocating a sorted copy.
+        block.thresholds.sort()
+        results[:, 1] = np.searchsorted(block.thresholds, cycles, side='left')
+    results[:, 1] /= num_cells
+
+    return results
+
+@njit(parallel=True, cache=True)
+def _replicate_failure_counts(thresholds, cycles):
+    """Counts the failed cells at each sampled cycle for every replicate row."""
+    out = np.empty((thresholds.shape[0], cycles.shape[0]), dtype=np.int64)
+    for r in prange(thresholds.shape[0]):
+        out[r, :] = np.searchsorted(np.sort(thresholds[r]), cycles)
+    return out
+
+def run_replicates(num_cells, mean_endurance, std_dev, num_replicates, seed=None):
+    """
+    Simulates num_replicates independent blocks of one NAND type so the
+    spread of the BER curve can be studied, not just one realization.
+    Returns (cycles, bers) where bers has one row per replicate.
+    """
+    max_cycles = mean_endurance + (4 * std_dev)
+    cycles = sample_cycles(max_cycles)
+
+    # Draw each block from its own child seed, then count all blocks in parallel
+    seeds = np.random.SeedSequence(seed).spawn(num_replicates)
+    thresholds = np.stack([
+        CellBlock.sample(num_cells, mean_endurance, std_dev, max_cycles, np.random.default_rng(s)).thresholds
+        for s in seeds
+    ])
+    bers = _replicate_failure_counts(thresholds, cycles) / num_cells
+    return cycles, bers
+
+def report_results(nand_name, results):
+    """Prints the BER at ten evenly spaced points of a simulation's results."""
+    print(f"--- Simulation results for {nand_name} ---")
+    cycles = results[:, 0]
+    max_cycles = int(cycles[-1])
+
+    # First sampled cycle at or past each tenth of the run
+    targets = max_cycles * np.arange(1, 11) // 10
+    for cycle, ber in results[np.searchsorted(cycles, targets)]:
+        print(f"  Cycle {int(cycle)}/{max_cycles} | BER: {ber:.6f}")
+    print()
+
+def plot_comparison_curves(results_dict):
+    """Plots the BER curves for multiple NAND types on a single graph."""
+    plt.figure(figsize=(12, 8))
+    
+    for nand_name, results_array in results_dict.items():
+        # Unpack the results array into cycles (x) and BER (y)
+        cycles = results_array[:, 0]
+        bers = results_array[:, 1]
+        plt.plot(cycles, bers, label=nand_name)
+        
+    # --- IMPORTANT: Use a logarithmic scale for the Y-axis ---
+    plt.yscale('log')
+    
+    plt.title('NAND Flash Endurance Comparison', fontsize=16)
+    plt.xlabel('Program/Erase (P/E) Cycles', fontsize=12)
+    plt.ylabel('Bit Error Rate (BER) - Log Scale', fontsize=12)
+    plt.grid(True, which="both", linestyle='--')
+    plt.legend()
+    
+    # Define the output directory
+    output_dir = 'results'
+    
+    # Create the directory if it doesn't already exist
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+        print(f"Created directory: {output_dir}")
+    
+    # Save the figure to the specified directory
+    output_path = os.path.join(output_dir, 'nand_endurance_comparison.png')
+    plt.savefig(output_path, dpi=300)
+    print(f"Plot successfully saved to {output_path}")